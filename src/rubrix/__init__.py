@@ -34,6 +34,7 @@ if _TYPE_CHECKING:
         delete,
         get_workspace,
         init,
+        iter_load,
         load,
         log,
         log_async,
@@ -67,6 +68,7 @@ _import_structure = {
         "delete",
         "get_workspace",
         "init",
+        "iter_load",
         "load",
         "log",
         "log_async",
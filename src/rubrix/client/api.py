@@ -16,11 +16,26 @@ import asyncio
 import logging
 import os
 import re
+import time
 import warnings
 from asyncio import Future
-from functools import wraps
+from functools import partial, wraps
 from inspect import signature
-from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sized,
+    Tuple,
+    Type,
+    Union,
+)
 
 from tqdm.auto import tqdm
 
@@ -29,9 +44,11 @@ from rubrix._constants import (
     DEFAULT_API_KEY,
     RUBRIX_WORKSPACE_HEADER_NAME,
 )
+from rubrix.client.apis import api_compatibility
 from rubrix.client.apis.datasets import Datasets
 from rubrix.client.apis.metrics import MetricsAPI
 from rubrix.client.apis.searches import Searches
+from rubrix.client.apis.status import Status
 from rubrix.client.datasets import (
     Dataset,
     DatasetForText2Text,
@@ -47,7 +64,7 @@ from rubrix.client.models import (
     TokenClassificationRecord,
 )
 from rubrix.client.sdk.client import AuthenticatedClient
-from rubrix.client.sdk.commons.api import async_bulk
+from rubrix.client.sdk.commons.api import async_bulk_raw, iter_bulk_body
 from rubrix.client.sdk.commons.errors import RubrixClientError
 from rubrix.client.sdk.datasets import api as datasets_api
 from rubrix.client.sdk.datasets.models import CopyDatasetRequest, TaskType
@@ -79,6 +96,61 @@ from rubrix.utils import setup_loop_in_thread
 
 _LOGGER = logging.getLogger(__name__)
 
+_DATASET_NAME_RE = re.compile(DATASET_NAME_REGEX_PATTERN)
+
+_SINGLE_RECORD_TYPES = Record.__args__
+
+# Bulk and creation classes used to log each record type
+_BULK_CLASSES = {
+    TextClassificationRecord: (
+        TextClassificationBulkData,
+        CreationTextClassificationRecord,
+    ),
+    TokenClassificationRecord: (
+        TokenClassificationBulkData,
+        CreationTokenClassificationRecord,
+    ),
+    Text2TextRecord: (Text2TextBulkData, CreationText2TextRecord),
+}
+
+# Data endpoint, query class and dataset class used to load each task
+_LOAD_TASK_CONFIG = {
+    TaskType.text_classification: (
+        text_classification_api.data,
+        TextClassificationQuery,
+        DatasetForTextClassification,
+    ),
+    TaskType.token_classification: (
+        token_classification_api.data,
+        TokenClassificationQuery,
+        DatasetForTokenClassification,
+    ),
+    TaskType.text2text: (
+        text2text_api.data,
+        Text2TextQuery,
+        DatasetForText2Text,
+    ),
+}
+
+
+def _iter_chunks(records: Iterable[Record], size: int) -> Iterator[List[Record]]:
+    """Lazily splits an iterable of records into lists of at most `size` elements"""
+    iterator = iter(records)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def _sort_records_by_id(records: List[Record]) -> List[Record]:
+    """Sorts the loaded records by their ID"""
+    ids = [record.id for record in records]
+    # record ids can be a mix of int/str -> sort all as str type
+    if len({type(id_) for id_ in ids}) > 1:
+        ids = [str(id_) for id_ in ids]
+    order = sorted(range(len(records)), key=ids.__getitem__)
+    return [records[i] for i in order]
+
 
 class _RubrixLogAgent:
     def __init__(self, api: "Api"):
@@ -106,6 +178,10 @@ class _RubrixLogAgent:
 class Api:
     # Larger sizes will trigger a warning
     _MAX_CHUNK_SIZE = 5000
+    # Seconds the dataset info and metrics are cached for
+    _CACHE_TTL = 30
+    # Servers decompress gzip encoded requests from this version on
+    _COMPRESSION_MIN_API_VERSION = "0.17.0"
 
     def __init__(
         self,
@@ -113,6 +189,7 @@ class Api:
         api_key: Optional[str] = None,
         workspace: Optional[str] = None,
         timeout: int = 60,
+        compress: bool = True,
     ):
         """Init the Python client.
 
@@ -127,6 +204,8 @@ class Api:
             workspace: The workspace to which records will be logged/loaded. If `None` (default) and the
                 env variable ``RUBRIX_WORKSPACE`` is not set, it will default to the private user workspace.
             timeout: Wait `timeout` seconds for the connection to timeout. Default: 60.
+            compress: If True (default), logged records are sent gzip compressed. Only servers from version
+                0.17.0 on decompress requests, so records are sent uncompressed to older servers.
 
         Examples:
             >>> import rubrix as rb
@@ -134,13 +213,16 @@ class Api:
         """
         api_url = api_url or os.getenv("RUBRIX_API_URL", "http://localhost:6900")
         # Checking that the api_url does not end in '/'
-        api_url = re.sub(r"\/$", "", api_url)
+        api_url = api_url.rstrip("/")
         api_key = api_key or os.getenv("RUBRIX_API_KEY", DEFAULT_API_KEY)
         workspace = workspace or os.getenv("RUBRIX_WORKSPACE")
 
         self._client: AuthenticatedClient = AuthenticatedClient(
             base_url=api_url, token=api_key, timeout=timeout
         )
+        self._compress = compress
+        self._server_decompresses_requests: Optional[bool] = None
+        self._cache: Dict[Tuple[str, str, str], Tuple[float, Any]] = {}
         self._user: User = users_api.whoami(client=self._client)
 
         if workspace is not None:
@@ -148,6 +230,23 @@ class Api:
 
         self._agent = _RubrixLogAgent(self)
 
+    def __enter__(self) -> "Api":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Closes the connections to the REST API. The client can not be used afterwards.
+
+        Examples:
+            >>> import rubrix as rb
+            >>> from rubrix.client.api import Api
+            >>> with Api() as api:
+            ...     api.log(rb.TextClassificationRecord(text="my first rubrix example"), name="example-dataset")
+        """
+        self._client.close()
+
     def __del__(self):
         if hasattr(self, "_client"):
             del self._client
@@ -218,6 +317,7 @@ class Api:
             name=dataset,
             json_body=CopyDatasetRequest(name=name_of_copy, target_workspace=workspace),
         )
+        self._invalidate_cache(name_of_copy, workspace=workspace)
 
     def delete(self, name: str) -> None:
         """Deletes a dataset.
@@ -230,6 +330,7 @@ class Api:
             >>> rb.delete(name="example-dataset")
         """
         datasets_api.delete_dataset(client=self._client, name=name)
+        self._invalidate_cache(name)
 
     def log(
         self,
@@ -240,6 +341,7 @@ class Api:
         chunk_size: int = 500,
         verbose: bool = True,
         background: bool = False,
+        concurrency: int = 4,
     ) -> Union[BulkResponse, Future]:
         """Logs Records to Rubrix.
 
@@ -254,6 +356,7 @@ class Api:
             verbose: If True, shows a progress bar and prints out a quick summary at the end.
             background: If True, we will NOT wait for the logging process to finish and return an ``asyncio.Future``
                 object. You probably want to set ``verbose`` to False in that case.
+            concurrency: The maximum number of data bulks sent to the server at the same time.
 
         Returns:
             Summary of the response from the REST API.
@@ -280,14 +383,12 @@ class Api:
             metadata=metadata,
             chunk_size=chunk_size,
             verbose=verbose,
+            concurrency=concurrency,
         )
         if background:
             return future
 
-        try:
-            return future.result()
-        finally:
-            future.cancel()
+        return future.result()
 
     async def log_async(
         self,
@@ -297,6 +398,7 @@ class Api:
         metadata: Optional[Dict[str, Any]] = None,
         chunk_size: int = 500,
         verbose: bool = True,
+        concurrency: int = 4,
     ) -> BulkResponse:
         """Logs Records to Rubrix with asyncio.
 
@@ -307,6 +409,7 @@ class Api:
             metadata: A dictionary of extra info for the dataset.
             chunk_size: The chunk size for a data bulk.
             verbose: If True, shows a progress bar and prints out a quick summary at the end.
+            concurrency: The maximum number of data bulks sent to the server at the same time.
 
         Returns:
             Summary of the response from the REST API
@@ -327,12 +430,15 @@ class Api:
         if not name:
             raise InputValueError("Empty dataset name has been passed as argument.")
 
-        if not re.match(DATASET_NAME_REGEX_PATTERN, name):
+        if not _DATASET_NAME_RE.match(name):
             raise InputValueError(
                 f"Provided dataset name {name} does not match the pattern {DATASET_NAME_REGEX_PATTERN}. "
                 "Please, use a valid name for your dataset"
             )
 
+        if concurrency < 1:
+            raise InputValueError("The concurrency must be a positive integer.")
+
         if chunk_size > self._MAX_CHUNK_SIZE:
             _LOGGER.warning(
                 """The introduced chunk size is noticeably large, timeout errors may occur.
@@ -340,49 +446,78 @@ class Api:
                 self._MAX_CHUNK_SIZE,
             )
 
-        if isinstance(records, Record.__args__):
+        if isinstance(records, _SINGLE_RECORD_TYPES):
             records = [records]
-        records = list(records)
+        total = len(records) if isinstance(records, Sized) else None
+        chunks = _iter_chunks(records, size=chunk_size)
 
-        try:
-            record_type = type(records[0])
-        except IndexError:
+        first_chunk = next(chunks, None)
+        if not first_chunk:
             raise InputValueError("Empty record list has been passed as argument.")
+        record_type = type(first_chunk[0])
 
-        if record_type is TextClassificationRecord:
-            bulk_class = TextClassificationBulkData
-            creation_class = CreationTextClassificationRecord
-        elif record_type is TokenClassificationRecord:
-            bulk_class = TokenClassificationBulkData
-            creation_class = CreationTokenClassificationRecord
-        elif record_type is Text2TextRecord:
-            bulk_class = Text2TextBulkData
-            creation_class = CreationText2TextRecord
-        else:
+        try:
+            bulk_class, creation_class = _BULK_CLASSES[record_type]
+        except KeyError:
             raise InputValueError(
-                f"Unknown record type {record_type}. Available values are {Record.__args__}"
+                f"Unknown record type {record_type}. Available values are {_SINGLE_RECORD_TYPES}"
             )
 
-        processed, failed = 0, 0
-        progress_bar = tqdm(total=len(records), disable=not verbose)
-        for i in range(0, len(records), chunk_size):
-            chunk = records[i : i + chunk_size]
+        if self._compress and self._server_decompresses_requests is None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._check_server_decompresses_requests
+            )
+        compress = self._compress and self._server_decompresses_requests
+
+        progress_bar = tqdm(total=total, disable=not verbose)
 
-            response = await async_bulk(
+        async def send_bulk(chunk: List[Record]):
+            # Records are serialized while the body is streamed, so the full payload is never held in memory
+            body = iter_bulk_body(
+                tags=tags,
+                metadata=metadata,
+                records=(creation_class.dict_from_client(r) for r in chunk),
+            )
+            response = await async_bulk_raw(
                 client=self._client,
                 name=name,
-                json_body=bulk_class(
-                    tags=tags,
-                    metadata=metadata,
-                    records=[creation_class.from_client(r) for r in chunk],
-                ),
+                bulk_class=bulk_class,
+                body=body,
+                compress=compress,
+                error_context=lambda: {
+                    "tags": tags,
+                    "metadata": metadata,
+                    "records": [creation_class.dict_from_client(r) for r in chunk],
+                },
             )
+            progress_bar.update(len(chunk))
+            return response.parsed
 
-            processed += response.parsed.processed
-            failed += response.parsed.failed
+        done, pending = set(), set()
+        try:
+            # The first bulk may create the dataset, so we wait for it before sending the rest
+            responses = [await send_bulk(first_chunk)]
+            self._invalidate_cache(name)
+            # Chunks are pulled lazily, keeping at most `concurrency` bulks in flight
+            for chunk in chunks:
+                if len(pending) >= concurrency:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    responses.extend(task.result() for task in done)
+                pending.add(asyncio.ensure_future(send_bulk(chunk)))
+            if pending:
+                done, pending = await asyncio.wait(pending)
+                responses.extend(task.result() for task in done)
+        finally:
+            for task in pending:
+                task.cancel()
+            # Waits for the cancelled bulks and retrieves the errors of the finished ones, if a bulk failed
+            await asyncio.gather(*done, *pending, return_exceptions=True)
+            progress_bar.close()
 
-            progress_bar.update(len(chunk))
-        progress_bar.close()
+        processed = sum(response.processed for response in responses)
+        failed = sum(response.failed for response in responses)
 
         # TODO: improve logging policy in library
         if verbose:
@@ -465,59 +600,157 @@ class Api:
                 "If you want a pandas DataFrame do `rb.load('my_dataset').to_pandas()`.",
             )
 
-        response = datasets_api.get_dataset(client=self._client, name=name)
-        task = response.parsed.task
-
-        task_config = {
-            TaskType.text_classification: (
-                text_classification_api.data,
-                TextClassificationQuery,
-                DatasetForTextClassification,
-            ),
-            TaskType.token_classification: (
-                token_classification_api.data,
-                TokenClassificationQuery,
-                DatasetForTokenClassification,
-            ),
-            TaskType.text2text: (
-                text2text_api.data,
-                Text2TextQuery,
-                DatasetForText2Text,
-            ),
-        }
-
-        try:
-            get_dataset_data, request_class, dataset_class = task_config[task]
-        except KeyError:
-            raise ValueError(
-                f"Load method not supported for the '{task}' task. Supported tasks: "
-                f"{[TaskType.text_classification, TaskType.token_classification, TaskType.text2text]}"
-            )
+        get_dataset_data, request_class, dataset_class = self._load_config(name)
         response = get_dataset_data(
             client=self._client,
             name=name,
             request=request_class(ids=ids, query_text=query),
             limit=limit,
             id_from=id_from,
+            to_client=True,
         )
 
-        records = [sdk_record.to_client() for sdk_record in response.parsed]
+        return dataset_class(_sort_records_by_id(response.parsed))
+
+    async def iter_load(
+        self,
+        name: str,
+        query: Optional[str] = None,
+        batch_size: int = 1000,
+        prefetch: int = 2,
+    ) -> AsyncIterator[Dataset]:
+        """Loads a Rubrix dataset in batches, fetching the next batches while the current one is consumed.
+
+        Args:
+            name: The dataset name.
+            query: An ElasticSearch query with the
+                `query string syntax <https://rubrix.readthedocs.io/en/stable/guides/queries.html>`_
+            batch_size: The number of records of each batch.
+            prefetch: The maximum number of batches fetched ahead of the consumer.
+
+        Yields:
+            Rubrix datasets with up to ``batch_size`` records each, sorted by their ID.
+
+        Examples:
+            >>> import asyncio
+            >>> import rubrix as rb
+            >>> async def count_records():
+            ...     count = 0
+            ...     async for batch in rb.iter_load(name="example-dataset", batch_size=500):
+            ...         count += len(batch)
+            ...     return count
+            >>> asyncio.run(count_records())
+        """
+        if batch_size < 1:
+            raise InputValueError("The batch size must be a positive integer.")
+        if prefetch < 1:
+            raise InputValueError("The prefetch must be a positive integer.")
+
+        loop = asyncio.get_running_loop()
+        get_dataset_data, request_class, dataset_class = await loop.run_in_executor(
+            None, self._load_config, name
+        )
+        request = request_class(query_text=query)
+        batches = asyncio.Queue(maxsize=prefetch)
+
+        async def fetch_batches():
+            id_from = None
+            try:
+                while True:
+                    response = await loop.run_in_executor(
+                        None,
+                        partial(
+                            get_dataset_data,
+                            client=self._client,
+                            name=name,
+                            request=request,
+                            limit=batch_size,
+                            id_from=id_from,
+                            to_client=True,
+                        ),
+                    )
+                    records = response.parsed
+                    if records:
+                        await batches.put(dataset_class(_sort_records_by_id(records)))
+                    if len(records) < batch_size:
+                        break
+                    # the server pages by id, so the next page starts after the last record it sent
+                    id_from = str(records[-1].id)
+                await batches.put(None)
+            except Exception as ex:
+                await batches.put(ex)
+
+        fetcher = asyncio.ensure_future(fetch_batches())
         try:
-            records_sorted_by_id = sorted(records, key=lambda x: x.id)
-        # record ids can be a mix of int/str -> sort all as str type
-        except TypeError:
-            records_sorted_by_id = sorted(records, key=lambda x: str(x.id))
+            while True:
+                batch = await batches.get()
+                if batch is None:
+                    return
+                if isinstance(batch, Exception):
+                    raise batch
+                yield batch
+        finally:
+            fetcher.cancel()
 
-        return dataset_class(records_sorted_by_id)
+    def _load_config(self, name: str) -> Tuple[Callable, Type, Type[Dataset]]:
+        """Returns the data endpoint, query class and dataset class used to load the dataset"""
+        response = datasets_api.get_dataset(client=self._client, name=name)
+        task = response.parsed.task
+
+        try:
+            return _LOAD_TASK_CONFIG[task]
+        except KeyError:
+            raise ValueError(
+                f"Load method not supported for the '{task}' task. Supported tasks: "
+                f"{list(_LOAD_TASK_CONFIG)}"
+            )
+
+    def _check_server_decompresses_requests(self):
+        """Checks, only once, if the server version is recent enough to accept gzip encoded requests"""
+        try:
+            with api_compatibility(
+                Status(client=self._client),
+                min_version=self._COMPRESSION_MIN_API_VERSION,
+            ):
+                self._server_decompresses_requests = True
+        except (RubrixClientError, ValueError):
+            # Unreachable, older or unparseable server info -> send the records uncompressed
+            self._server_decompresses_requests = False
+
+    def _cached(self, kind: str, name: str, compute: Callable[[], Any]) -> Any:
+        """Returns the cached value for a dataset in the active workspace, computing it if missing or expired"""
+        key = (kind, self.get_workspace(), name)
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and now - cached[0] < self._CACHE_TTL:
+            return cached[1]
+
+        value = compute()
+        self._cache[key] = (now, value)
+        return value
+
+    def _invalidate_cache(self, name: str, workspace: Optional[str] = None):
+        """Removes the cached values of a dataset"""
+        workspace = workspace or self.get_workspace()
+        for kind in ["dataset", "metrics"]:
+            self._cache.pop((kind, workspace, name), None)
+
+    def _get_dataset_task(self, name: str) -> TaskType:
+        return self._cached(
+            "dataset",
+            name,
+            lambda: datasets_api.get_dataset(self._client, name).parsed,
+        ).task
 
     def dataset_metrics(self, name: str) -> List[MetricInfo]:
-        response = datasets_api.get_dataset(self._client, name)
-        response = metrics_api.get_dataset_metrics(
-            self._client, name=name, task=response.parsed.task
+        return self._cached(
+            "metrics",
+            name,
+            lambda: metrics_api.get_dataset_metrics(
+                self._client, name=name, task=self._get_dataset_task(name)
+            ).parsed,
         )
 
-        return response.parsed
-
     def get_metric(self, name: str, metric: str) -> Optional[MetricInfo]:
         metrics = self.dataset_metrics(name)
         for metric_ in metrics:
@@ -532,15 +765,13 @@ class Api:
         interval: Optional[float] = None,
         size: Optional[int] = None,
     ) -> MetricResults:
-        response = datasets_api.get_dataset(self._client, name)
-
         metric_ = self.get_metric(name, metric=metric)
         assert metric_ is not None, f"Metric {metric} not found !!!"
 
         response = metrics_api.compute_metric(
             self._client,
             name=name,
-            task=response.parsed.task,
+            task=self._get_dataset_task(name),
             metric=metric,
             query=query,
             interval=interval,
@@ -649,5 +880,10 @@ def load(*args, **kwargs):
     return active_api().load(*args, **kwargs)
 
 
+@api_wrapper(Api.iter_load)
+def iter_load(*args, **kwargs):
+    return active_api().iter_load(*args, **kwargs)
+
+
 class InputValueError(RubrixClientError):
     pass
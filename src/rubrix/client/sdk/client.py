@@ -12,12 +12,22 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import asyncio
 import dataclasses
 import functools
-from typing import Dict, TypeVar
+import threading
+import weakref
+from typing import Dict, Optional, TypeVar
 
 import httpx
 
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ModuleNotFoundError:
+    _HTTP2_AVAILABLE = False
+
 from rubrix._constants import API_KEY_HEADER_NAME
 from rubrix.client.sdk._helpers import build_raw_response
 from rubrix.client.sdk.commons.errors import RubrixClientError
@@ -26,6 +36,13 @@ from rubrix.client.sdk.commons.errors import RubrixClientError
 @dataclasses.dataclass
 class _ClientCommonDefaults:
     __httpx__: httpx.Client = dataclasses.field(default=None, init=False, compare=False)
+    # The async httpx clients, by the event loop they are bound to
+    __async_httpx_clients__: weakref.WeakKeyDictionary = dataclasses.field(
+        default_factory=weakref.WeakKeyDictionary, init=False, compare=False
+    )
+    __async_httpx_lock__: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock, init=False, compare=False
+    )
 
     cookies: Dict[str, str] = dataclasses.field(default_factory=dict)
     headers: Dict[str, str] = dataclasses.field(default_factory=dict)
@@ -66,11 +83,58 @@ class Client(_ClientCommonDefaults, _Client):
             headers=self.get_headers(),
             cookies=self.get_cookies(),
             timeout=self.get_timeout(),
+            http2=_HTTP2_AVAILABLE,
         )
 
     def __del__(self):
+        self._close_async_httpx_clients()
         del self.__httpx__
 
+    def get_async_httpx(self) -> httpx.AsyncClient:
+        """Returns an async httpx client bound to the running event loop.
+
+        One client is kept per event loop, so its connections are reused and loggers running on different loops
+        never share or close each other's client. If the ``h2`` package is installed, HTTP/2 is negotiated with
+        servers that support it.
+        """
+        loop = asyncio.get_running_loop()
+        with self.__async_httpx_lock__:
+            async_httpx = self.__async_httpx_clients__.get(loop)
+            if async_httpx is None:
+                # Clients of closed loops can no longer be used nor closed, so they are just dropped
+                for other_loop in list(self.__async_httpx_clients__):
+                    if other_loop.is_closed():
+                        del self.__async_httpx_clients__[other_loop]
+                async_httpx = httpx.AsyncClient(http2=_HTTP2_AVAILABLE)
+                self.__async_httpx_clients__[loop] = async_httpx
+        return async_httpx
+
+    def close(self, timeout: float = 5.0):
+        """Closes the underlying httpx clients and their connections."""
+        if self.__httpx__ is not None:
+            self.__httpx__.close()
+        self._close_async_httpx_clients(timeout=timeout)
+
+    def _close_async_httpx_clients(self, timeout: Optional[float] = None):
+        """Closes the async httpx clients on their event loops, if the loops are still running.
+
+        If a ``timeout`` is provided, waits up to ``timeout`` seconds for each client to be closed.
+        """
+        with self.__async_httpx_lock__:
+            clients = list(self.__async_httpx_clients__.items())
+            self.__async_httpx_clients__.clear()
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+        for loop, async_httpx in clients:
+            if not loop.is_running():
+                continue
+            future = asyncio.run_coroutine_threadsafe(async_httpx.aclose(), loop)
+            # Waiting from the loop itself would block it, so the client is closed later in that case
+            if timeout is not None and loop is not current_loop:
+                future.result(timeout=timeout)
+
     def __hash__(self):
         return hash(self.base_url)
 
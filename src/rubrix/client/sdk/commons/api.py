@@ -25,11 +25,30 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import gzip
 import json
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+import zlib
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import httpx
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
 from rubrix.client.sdk.client import AuthenticatedClient
 from rubrix.client.sdk.commons.errors import GenericApiError
 from rubrix.client.sdk.commons.errors_handler import handle_response_error
@@ -49,12 +68,17 @@ _TASK_TO_ENDPOINT = {
     Text2TextBulkData: "Text2Text",
 }
 
+# Bodies smaller than this are sent uncompressed, since gzip won't pay off for them
+_GZIP_MIN_SIZE = 4096
+# Streamed bodies are sent in pieces of about this size
+_STREAM_PIECE_SIZE = 65536
+
 
 def build_param_dict(
     id_from: Optional[str], limit: Optional[int]
 ) -> Optional[Dict[str, Union[str, int]]]:
     params = {}
-    if id_from:
+    if id_from is not None:
         params["id_from"] = id_from
     if limit:
         params["limit"] = limit
@@ -90,18 +114,144 @@ async def async_bulk(
 ) -> Response[BulkResponse]:
     url = f"{client.base_url}/api/datasets/{name}/{_TASK_TO_ENDPOINT[type(json_body)]}:bulk"
 
-    async with httpx.AsyncClient() as async_client:
-        response = await async_client.post(
-            url=url,
-            headers=client.get_headers(),
-            cookies=client.get_cookies(),
-            timeout=client.get_timeout(),
-            json=json_body.dict(by_alias=True),
-        )
+    response = await client.get_async_httpx().post(
+        url=url,
+        headers=client.get_headers(),
+        cookies=client.get_cookies(),
+        timeout=client.get_timeout(),
+        json=json_body.dict(by_alias=True),
+    )
 
     return build_bulk_response(response, name=name, body=json_body)
 
 
+def _json_default(obj: Any) -> Any:
+    """Serializes numpy values not natively supported by orjson (e.g. non contiguous arrays) or by json"""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(data, default=_json_default).encode("utf-8")
+
+
+async def iter_bulk_body(
+    tags: Dict[str, str],
+    metadata: Dict[str, Any],
+    records: Iterable[Dict[str, Any]],
+) -> AsyncIterator[bytes]:
+    """Serializes a bulk payload to json bytes record by record.
+
+    Only one piece of the body is kept in memory at a time, so it can be sent with a chunked transfer encoding.
+    """
+    pieces = [
+        b'{"tags":',
+        _dumps(tags),
+        b',"metadata":',
+        _dumps(metadata),
+        b',"records":[',
+    ]
+    size = 0
+    for i, record in enumerate(records):
+        if i:
+            pieces.append(b",")
+        data = _dumps(record)
+        pieces.append(data)
+        size += len(data)
+        if size >= _STREAM_PIECE_SIZE:
+            yield b"".join(pieces)
+            pieces, size = [], 0
+    pieces.append(b"]}")
+    yield b"".join(pieces)
+
+
+async def _buffer_small_body(
+    body: AsyncIterable[bytes],
+) -> Union[bytes, AsyncIterator[bytes]]:
+    """Returns the body as bytes if it consists of a single piece, otherwise a stream of all its pieces"""
+    pieces = body.__aiter__()
+    try:
+        first_piece = await pieces.__anext__()
+    except StopAsyncIteration:
+        return b""
+    try:
+        second_piece = await pieces.__anext__()
+    except StopAsyncIteration:
+        return first_piece
+
+    async def stream():
+        yield first_piece
+        yield second_piece
+        async for piece in pieces:
+            yield piece
+
+    return stream()
+
+
+async def _gzip_stream(body: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(1, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for piece in body:
+        compressed = compressor.compress(piece)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+async def async_bulk_raw(
+    client: AuthenticatedClient,
+    name: str,
+    bulk_class: Type[
+        Union[
+            TextClassificationBulkData, TokenClassificationBulkData, Text2TextBulkData
+        ]
+    ],
+    body: Union[bytes, AsyncIterable[bytes]],
+    compress: bool = False,
+    error_context: Optional[Callable[[], Dict[str, Any]]] = None,
+) -> Response[BulkResponse]:
+    """Same as ``async_bulk``, but posts an already serialized json body.
+
+    The body can also be an async iterable of bytes (see ``iter_bulk_body``), which is streamed to the server.
+    Streamed bodies that fit in a single piece are sent as plain bytes instead.
+    If ``compress`` is True, bodies larger than 4 KB are sent gzip encoded.
+    Since the serialized body can not be inspected, ``error_context`` builds the request data that server
+    validation errors are matched against. It is only called if the request fails.
+    """
+    url = f"{client.base_url}/api/datasets/{name}/{_TASK_TO_ENDPOINT[bulk_class]}:bulk"
+
+    headers = {**client.get_headers(), "Content-Type": "application/json"}
+    if not isinstance(body, bytes):
+        body = await _buffer_small_body(body)
+    # Streamed bodies are larger than a piece, so they are always worth compressing
+    if compress and not isinstance(body, bytes):
+        body = _gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+    elif compress and len(body) > _GZIP_MIN_SIZE:
+        body = gzip.compress(body, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
+
+    response = await client.get_async_httpx().post(
+        url=url,
+        headers=headers,
+        cookies=client.get_cookies(),
+        timeout=client.get_timeout(),
+        content=body,
+    )
+
+    return build_bulk_response(
+        response,
+        name=name,
+        body=error_context() if error_context and response.is_error else None,
+    )
+
+
 def build_bulk_response(
     response: httpx.Response, name: str, body: Any
 ) -> Response[BulkResponse]:
@@ -120,15 +270,26 @@ def build_bulk_response(
 T = TypeVar("T")
 
 
+def _loads(data: Union[str, bytes]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def build_data_response(
-    response: httpx.Response, data_type: Type[T]
+    response: httpx.Response, data_type: Type[T], to_client: bool = False
 ) -> Response[List[T]]:
+    """Parses the streamed records of a data response.
+
+    If ``to_client`` is True, the records are directly parsed into client records with ``data_type.dict_to_client``.
+    """
+    parse = data_type.dict_to_client if to_client else lambda data: data_type(**data)
     if 200 <= response.status_code < 400:
         parsed_responses = []
         for r in response.iter_lines():
-            parsed_record = json.loads(r)
+            parsed_record = _loads(r)
             try:
-                parsed_response = data_type(**parsed_record)
+                parsed_response = parse(parsed_record)
             except Exception as err:
                 raise GenericApiError(**parsed_record) from None
             parsed_responses.append(parsed_response)
@@ -140,7 +301,7 @@ def build_data_response(
         )
 
     content = next(response.iter_lines())
-    data = json.loads(content)
+    data = _loads(content)
     return handle_response_error(response, **data, parse_response=False)
 
 
@@ -42,7 +42,7 @@ class ValidationApiError(RubrixApiResponseError):
                 new_value = None
                 try:
                     new_value = current_level[loc]
-                except KeyError:
+                except (KeyError, IndexError, TypeError):
                     pass
                 if new_value is None:
                     break
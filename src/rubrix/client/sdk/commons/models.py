@@ -48,6 +48,20 @@ class BaseRecord(GenericModel, Generic[T]):
     metrics: Dict[str, Any] = Field(default_factory=dict)
     search_keywords: Optional[List[str]] = None
 
+    @staticmethod
+    def _common_dict_from_client(record) -> Dict[str, Any]:
+        """Builds the json-compatible dict of the fields shared by all client records"""
+        return {
+            "id": record.id,
+            "metadata": record.metadata,
+            "event_timestamp": record.event_timestamp.isoformat()
+            if record.event_timestamp is not None
+            else None,
+            "status": record.status,
+            "metrics": {},
+            "search_keywords": None,
+        }
+
     # this is a small hack to get a json-compatible serialization on cls.dict(), which we use for the httpx calls.
     # they want to build this feature into pydantic, see https://github.com/samuelcolvin/pydantic/issues/1409
     @validator("event_timestamp")
@@ -28,6 +28,7 @@ def data(
     request: Optional[Text2TextQuery] = None,
     limit: Optional[int] = None,
     id_from: Optional[str] = None,
+    to_client: bool = False,
 ) -> Response[Union[List[Text2TextRecord], HTTPValidationError, ErrorMessage]]:
 
     path = f"/api/datasets/{name}/Text2Text/data"
@@ -39,4 +40,6 @@ def data(
         params=params if params else None,
         json=request.dict() if request else {},
     ) as response:
-        return build_data_response(response=response, data_type=Text2TextRecord)
+        return build_data_response(
+            response=response, data_type=Text2TextRecord, to_client=to_client
+        )
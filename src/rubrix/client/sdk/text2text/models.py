@@ -14,7 +14,7 @@
 #  limitations under the License.
 
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -72,6 +72,37 @@ class CreationText2TextRecord(BaseRecord[Text2TextAnnotation]):
             event_timestamp=record.event_timestamp,
         )
 
+    @classmethod
+    def dict_from_client(cls, record: ClientText2TextRecord) -> Dict[str, Any]:
+        """Same as ``from_client(record).dict(by_alias=True)``, but skips building and validating the models.
+
+        The server validates the logged records anyway.
+        """
+        prediction = None
+        if record.prediction is not None:
+            prediction = {
+                "sentences": [
+                    {"text": pred[0], "score": pred[1]}
+                    if isinstance(pred, tuple)
+                    else {"text": pred, "score": 1.0}
+                    for pred in record.prediction
+                ],
+                "agent": record.prediction_agent or MACHINE_NAME,
+            }
+        annotation = None
+        if record.annotation is not None:
+            annotation = {
+                "sentences": [{"text": record.annotation, "score": 1.0}],
+                "agent": record.annotation_agent or MACHINE_NAME,
+            }
+
+        return {
+            **cls._common_dict_from_client(record),
+            "text": record.text,
+            "prediction": prediction,
+            "annotation": annotation,
+        }
+
 
 class Text2TextRecord(CreationText2TextRecord):
     last_updated: datetime = None
@@ -97,6 +128,31 @@ class Text2TextRecord(CreationText2TextRecord):
             search_keywords=self.search_keywords or None,
         )
 
+    @staticmethod
+    def dict_to_client(data: Dict[str, Any]) -> ClientText2TextRecord:
+        """Same as ``Text2TextRecord(**data).to_client()``, but skips building the sdk model"""
+        prediction = data.get("prediction")
+        annotation = data.get("annotation")
+
+        return ClientText2TextRecord(
+            text=data["text"],
+            prediction=[
+                (sentence["text"], sentence.get("score", 1.0))
+                for sentence in prediction["sentences"]
+            ]
+            if prediction
+            else None,
+            prediction_agent=prediction["agent"] if prediction else None,
+            annotation=annotation["sentences"][0]["text"] if annotation else None,
+            annotation_agent=annotation["agent"] if annotation else None,
+            status=data.get("status"),
+            metadata=data.get("metadata") or {},
+            id=data.get("id"),
+            event_timestamp=data.get("event_timestamp"),
+            metrics=data.get("metrics") or None,
+            search_keywords=data.get("search_keywords") or None,
+        )
+
 
 class Text2TextBulkData(UpdateDatasetRequest):
     records: List[CreationText2TextRecord]
@@ -38,6 +38,7 @@ def data(
     request: Optional[TextClassificationQuery] = None,
     limit: Optional[int] = None,
     id_from: Optional[str] = None,
+    to_client: bool = False,
 ) -> Response[Union[List[TextClassificationRecord], HTTPValidationError, ErrorMessage]]:
 
     path = f"/api/datasets/{name}/TextClassification/data"
@@ -50,7 +51,7 @@ def data(
         json=request.dict() if request else {},
     ) as response:
         return build_data_response(
-            response=response, data_type=TextClassificationRecord
+            response=response, data_type=TextClassificationRecord, to_client=to_client
         )
 
 
@@ -13,7 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -89,6 +89,56 @@ class CreationTextClassificationRecord(BaseRecord[TextClassificationAnnotation])
             event_timestamp=record.event_timestamp,
         )
 
+    @classmethod
+    def dict_from_client(cls, record: ClientTextClassificationRecord) -> Dict[str, Any]:
+        """Same as ``from_client(record).dict(by_alias=True)``, but skips building and validating the models.
+
+        The server validates the logged records anyway.
+        """
+        prediction = None
+        if record.prediction is not None:
+            prediction = {
+                "labels": [
+                    {"class": label, "score": score}
+                    for label, score in record.prediction
+                ],
+                "agent": record.prediction_agent or MACHINE_NAME,
+            }
+
+        annotation = None
+        if record.annotation is not None:
+            annotation_list = (
+                record.annotation
+                if isinstance(record.annotation, list)
+                else [record.annotation]
+            )
+            annotation = {
+                "labels": [{"class": label, "score": 1.0} for label in annotation_list],
+                "agent": record.annotation_agent or MACHINE_NAME,
+            }
+
+        explanation = None
+        if record.explanation is not None:
+            explanation = {
+                key: [
+                    {
+                        "token": attribution.token,
+                        "attributions": attribution.attributions,
+                    }
+                    for attribution in attributions
+                ]
+                for key, attributions in record.explanation.items()
+            }
+
+        return {
+            **cls._common_dict_from_client(record),
+            "inputs": record.inputs,
+            "prediction": prediction,
+            "annotation": annotation,
+            "multi_label": record.multi_label,
+            "explanation": explanation,
+        }
+
 
 class TextClassificationRecord(CreationTextClassificationRecord):
     last_updated: datetime = None
@@ -132,6 +182,49 @@ class TextClassificationRecord(CreationTextClassificationRecord):
             search_keywords=self.search_keywords or None,
         )
 
+    @staticmethod
+    def dict_to_client(data: Dict[str, Any]) -> ClientTextClassificationRecord:
+        """Same as ``TextClassificationRecord(**data).to_client()``, but skips building the sdk model"""
+        multi_label = data.get("multi_label", False)
+        prediction = data.get("prediction")
+        annotation = data.get("annotation")
+        explanation = data.get("explanation")
+
+        annotations = (
+            [label["class"] for label in annotation["labels"]] if annotation else None
+        )
+        if annotations and not multi_label:
+            annotations = annotations[0]
+
+        return ClientTextClassificationRecord(
+            id=data.get("id"),
+            event_timestamp=data.get("event_timestamp"),
+            inputs=data["inputs"],
+            multi_label=multi_label,
+            status=data.get("status"),
+            metadata=data.get("metadata") or {},
+            prediction=[
+                (label["class"], label.get("score", 1.0))
+                for label in prediction["labels"]
+            ]
+            if prediction
+            else None,
+            prediction_agent=prediction["agent"] if prediction else None,
+            annotation=annotations,
+            annotation_agent=annotation["agent"] if annotation else None,
+            explanation={
+                key: [
+                    ClientTokenAttributions.parse_obj(attribution)
+                    for attribution in attributions
+                ]
+                for key, attributions in explanation.items()
+            }
+            if explanation
+            else None,
+            metrics=data.get("metrics") or None,
+            search_keywords=data.get("search_keywords") or None,
+        )
+
 
 class TextClassificationBulkData(UpdateDatasetRequest):
     records: List[CreationTextClassificationRecord]
@@ -32,6 +32,7 @@ def data(
     request: Optional[TokenClassificationQuery] = None,
     limit: Optional[int] = None,
     id_from: Optional[str] = None,
+    to_client: bool = False,
 ) -> Response[
     Union[List[TokenClassificationRecord], HTTPValidationError, ErrorMessage]
 ]:
@@ -46,5 +47,5 @@ def data(
         json=request.dict() if request else {},
     ) as response:
         return build_data_response(
-            response=response, data_type=TokenClassificationRecord
+            response=response, data_type=TokenClassificationRecord, to_client=to_client
         )
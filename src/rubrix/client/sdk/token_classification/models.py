@@ -13,7 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, validator
 
@@ -91,6 +91,49 @@ class CreationTokenClassificationRecord(BaseRecord[TokenClassificationAnnotation
             event_timestamp=record.event_timestamp,
         )
 
+    @classmethod
+    def dict_from_client(
+        cls, record: ClientTokenClassificationRecord
+    ) -> Dict[str, Any]:
+        """Same as ``from_client(record).dict(by_alias=True)``, but skips building and validating the models.
+
+        The server validates the logged records anyway.
+        """
+        prediction = None
+        if record.prediction is not None:
+            prediction = {
+                "entities": [
+                    {
+                        "label": ent[0],
+                        "start": ent[1],
+                        "end": ent[2],
+                        "score": ent[3] if len(ent) > 3 else 1.0,
+                    }
+                    for ent in record.prediction
+                ],
+                "score": None,
+                "agent": record.prediction_agent or MACHINE_NAME,
+            }
+
+        annotation = None
+        if record.annotation is not None:
+            annotation = {
+                "entities": [
+                    {"label": ent[0], "start": ent[1], "end": ent[2], "score": 1.0}
+                    for ent in record.annotation
+                ],
+                "score": None,
+                "agent": record.annotation_agent or MACHINE_NAME,
+            }
+
+        return {
+            **cls._common_dict_from_client(record),
+            "tokens": list(record.tokens),
+            "text": record.text,
+            "prediction": prediction,
+            "annotation": annotation,
+        }
+
 
 class TokenClassificationRecord(CreationTokenClassificationRecord):
     last_updated: datetime = None
@@ -121,6 +164,37 @@ class TokenClassificationRecord(CreationTokenClassificationRecord):
             search_keywords=self.search_keywords or None,
         )
 
+    @staticmethod
+    def dict_to_client(data: Dict[str, Any]) -> ClientTokenClassificationRecord:
+        """Same as ``TokenClassificationRecord(**data).to_client()``, but skips building the sdk model"""
+        prediction = data.get("prediction")
+        annotation = data.get("annotation")
+
+        return ClientTokenClassificationRecord(
+            text=data["text"],
+            tokens=data["tokens"],
+            prediction=[
+                (ent["label"], ent["start"], ent["end"], ent.get("score", 1.0))
+                for ent in prediction.get("entities", [])
+            ]
+            if prediction
+            else None,
+            prediction_agent=prediction["agent"] if prediction else None,
+            annotation=[
+                (ent["label"], ent["start"], ent["end"])
+                for ent in annotation.get("entities", [])
+            ]
+            if annotation
+            else None,
+            annotation_agent=annotation["agent"] if annotation else None,
+            id=data.get("id"),
+            event_timestamp=data.get("event_timestamp"),
+            status=data.get("status"),
+            metadata=data.get("metadata") or {},
+            metrics=data.get("metrics") or None,
+            search_keywords=data.get("search_keywords") or None,
+        )
+
 
 class TokenClassificationBulkData(UpdateDatasetRequest):
     records: List[CreationTokenClassificationRecord]
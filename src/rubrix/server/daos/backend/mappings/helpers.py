@@ -64,12 +64,12 @@ class mappings:
         }
 
     @staticmethod
-    def text_field():
-        """Mappings config for textual field"""
+    def text_field(norms: bool = True):
+        """Mappings config for textual field. Set `norms` to False to skip storing length norms"""
         default_analyzer = settings.default_es_search_analyzer
         exact_analyzer = settings.exact_es_search_analyzer
 
-        return {
+        mapping = {
             "type": "text",
             "analyzer": default_analyzer,
             "fields": {
@@ -83,6 +83,10 @@ class mappings:
             # TODO(@frascuchon): verify min es version that support meta fields
             # "meta": {"experimental": "true"},
         }
+        if not norms:
+            for field in [mapping, *mapping["fields"].values()]:
+                field["norms"] = False
+        return mapping
 
     @staticmethod
     def source(includes: List[str] = None, excludes: List[str] = None):
@@ -133,6 +137,8 @@ def tasks_common_settings():
     return {
         "number_of_shards": settings.es_records_index_shards,
         "number_of_replicas": settings.es_records_index_replicas,
+        # Stored fields (mostly record inputs) are compressed with deflate instead of LZ4
+        "codec": "best_compression",
         "analysis": {
             "analyzer": {
                 MULTILINGUAL_STOP_ANALYZER_REF: multilingual_stop_analyzer(),
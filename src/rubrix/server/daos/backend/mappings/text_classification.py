@@ -32,6 +32,12 @@ def text_classification_mappings():
             "score": mappings.decimal_field(),
         },
         "dynamic_templates": [
-            {"inputs.*": {"path_match": "inputs.*", "mapping": mappings.text_field()}}
+            {
+                "inputs.*": {
+                    "path_match": "inputs.*",
+                    # Inputs are searched but rarely ranked by length, so norms are not stored
+                    "mapping": mappings.text_field(norms=False),
+                }
+            }
         ],
     }
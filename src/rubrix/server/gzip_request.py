@@ -0,0 +1,89 @@
+#  coding=utf-8
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import zlib
+
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class GZipRequestMiddleware:
+    """Decompresses request bodies sent with a ``Content-Encoding: gzip`` header.
+
+    Bodies are decompressed while they are received, and requests whose decompressed body
+    exceeds ``max_size`` bytes are rejected with a 413 status code.
+    """
+
+    def __init__(self, app: ASGIApp, max_size: int = 100 * 1024 * 1024):
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self._is_gzip_encoded(scope):
+            await self.app(scope, receive, send)
+            return
+
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        pieces, size = [], 0
+        more_body = True
+        try:
+            while more_body:
+                message = await receive()
+                more_body = message.get("more_body", False)
+                # Asking for one byte more than allowed tells apart bodies that exceed the limit
+                piece = decompressor.decompress(
+                    message.get("body", b""), self.max_size - size + 1
+                )
+                size += len(piece)
+                if size > self.max_size:
+                    response = PlainTextResponse(
+                        "Decompressed request body too large", status_code=413
+                    )
+                    await response(scope, receive, send)
+                    return
+                pieces.append(piece)
+            valid_body = decompressor.eof and not decompressor.unused_data
+        except zlib.error:
+            valid_body = False
+
+        if not valid_body:
+            response = PlainTextResponse("Invalid gzip encoded body", status_code=400)
+            await response(scope, receive, send)
+            return
+
+        body = b"".join(pieces)
+        headers = [
+            (key, value)
+            for key, value in scope["headers"]
+            if key not in (b"content-encoding", b"content-length", b"transfer-encoding")
+        ]
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+
+        body_sent = False
+
+        async def receive_decompressed() -> Message:
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app({**scope, "headers": headers}, receive_decompressed, send)
+
+    @staticmethod
+    def _is_gzip_encoded(scope: Scope) -> bool:
+        for key, value in scope["headers"]:
+            if key == b"content-encoding":
+                return value.strip().lower() == b"gzip"
+        return False
@@ -31,6 +31,7 @@ from rubrix.server.daos.backend.elasticsearch import ElasticsearchBackend
 from rubrix.server.daos.datasets import DatasetsDAO
 from rubrix.server.daos.records import DatasetRecordsDAO
 from rubrix.server.errors import APIErrorHandler, EntityNotFoundError
+from rubrix.server.gzip_request import GZipRequestMiddleware
 from rubrix.server.routes import api_router
 from rubrix.server.security import auth
 from rubrix.server.settings import settings
@@ -49,6 +50,9 @@ def configure_middleware(app: FastAPI):
     )
 
     app.add_middleware(BrotliMiddleware, minimum_size=512, quality=7)
+    app.add_middleware(
+        GZipRequestMiddleware, max_size=settings.max_decompressed_request_size
+    )
 
 
 def configure_api_exceptions(api: FastAPI):
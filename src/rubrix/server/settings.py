@@ -51,6 +51,9 @@ class ApiSettings(BaseSettings):
     disable_es_index_template_creation: (DISABLE_ES_INDEX_TEMPLATE_CREATION env var)
          Allowing advanced users to create their own es index settings and mappings. Default=False
 
+    max_decompressed_request_size: (RUBRIX_MAX_DECOMPRESSED_REQUEST_SIZE env var)
+        Max size in bytes of a gzip encoded request body once decompressed. Default=100MB
+
     """
 
     __LOGGER__ = logging.getLogger(__name__)
@@ -80,6 +83,12 @@ class ApiSettings(BaseSettings):
         default=50, gt=0, le=100, description="Max number of fields in metadata"
     )
 
+    max_decompressed_request_size: int = Field(
+        default=100 * 1024 * 1024,
+        gt=0,
+        description="Max size in bytes of a decompressed gzip request body",
+    )
+
     enable_telemetry: bool = True
 
     telemetry_key: Optional[str] = None
@@ -13,6 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import asyncio
+import atexit
 import importlib
 import os
 import threading
@@ -149,10 +150,13 @@ def limit_value_length(data: Any, max_length: int) -> Any:
 
 
 __LOOP__, __THREAD__ = None, None
+__LOOP_LOCK__ = threading.Lock()
 
 
 def setup_loop_in_thread() -> Tuple[asyncio.AbstractEventLoop, threading.Thread]:
-    """Sets up a new asyncio event loop in a new thread, and runs it forever.
+    """Sets up an asyncio event loop in a new thread, and runs it forever.
+
+    The loop and thread are shared: subsequent calls return the same ones, as long as the thread is alive.
 
     Returns:
         A tuple containing the event loop and the thread.
@@ -165,11 +169,21 @@ def setup_loop_in_thread() -> Tuple[asyncio.AbstractEventLoop, threading.Thread]
     global __LOOP__
     global __THREAD__
 
-    if not (__LOOP__ and __THREAD__):
-        loop = asyncio.new_event_loop()
-        thread = threading.Thread(
-            target=start_background_loop, args=(loop,), daemon=True
-        )
-        thread.start()
-        __LOOP__, __THREAD__ = loop, thread
+    with __LOOP_LOCK__:
+        if not (__LOOP__ and __THREAD__ and __THREAD__.is_alive()):
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=start_background_loop, args=(loop,), daemon=True
+            )
+            thread.start()
+            __LOOP__, __THREAD__ = loop, thread
     return __LOOP__, __THREAD__
+
+
+@atexit.register
+def _stop_loop_in_thread(timeout: float = 5.0):
+    """Stops the shared event loop and waits for its thread to finish"""
+    with __LOOP_LOCK__:
+        if __LOOP__ and __THREAD__ and __THREAD__.is_alive():
+            __LOOP__.call_soon_threadsafe(__LOOP__.stop)
+            __THREAD__.join(timeout=timeout)
@@ -0,0 +1,98 @@
+#  coding=utf-8
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+import gzip
+import json
+
+import httpx
+import numpy as np
+import pytest
+
+from rubrix.client.sdk.client import AuthenticatedClient
+from rubrix.client.sdk.commons.api import _gzip_stream, async_bulk_raw, iter_bulk_body
+from rubrix.client.sdk.text_classification.models import TextClassificationBulkData
+
+
+async def join(body):
+    return b"".join([piece async for piece in body])
+
+
+def test_iter_bulk_body():
+    records = [{"id": i, "inputs": {"text": "mock text" * 1000}} for i in range(20)]
+
+    body = iter_bulk_body(tags={"mock": "tag"}, metadata={}, records=records)
+    assert json.loads(gzip.decompress(asyncio.run(join(_gzip_stream(body))))) == {
+        "tags": {"mock": "tag"},
+        "metadata": {},
+        "records": records,
+    }
+
+
+def test_iter_bulk_body_with_numpy_values():
+    metadata = {
+        "score": np.float32(0.5),
+        "counts": np.arange(4)[::2],
+        "vector": np.ones(2, dtype=np.float16),
+    }
+
+    body = iter_bulk_body(tags={}, metadata=metadata, records=[])
+    assert json.loads(asyncio.run(join(body))) == {
+        "tags": {},
+        "metadata": {"score": 0.5, "counts": [0, 2], "vector": [1.0, 1.0]},
+        "records": [],
+    }
+
+
+@pytest.mark.parametrize(
+    "text_length, streamed, expected_encoding",
+    [(10, False, None), (1000, False, "gzip"), (10000, True, "gzip")],
+)
+def test_async_bulk_raw_compression(
+    monkeypatch, text_length, streamed, expected_encoding
+):
+    sent = {}
+
+    class MockAsyncHttpx:
+        async def post(self, *args, headers, content, **kwargs):
+            sent["encoding"] = headers.get("Content-Encoding")
+            sent["streamed"] = not isinstance(content, bytes)
+            if sent["streamed"]:
+                content = await join(content)
+            if sent["encoding"] == "gzip":
+                content = gzip.decompress(content)
+            sent["body"] = json.loads(content)
+            return httpx.Response(
+                status_code=200,
+                json={"dataset": "mock-dataset", "processed": 10, "failed": 0},
+            )
+
+    client = AuthenticatedClient(base_url="http://localhost:6900", token="mock")
+    monkeypatch.setattr(client, "get_async_httpx", MockAsyncHttpx)
+
+    records = [{"id": i, "inputs": {"text": "a" * text_length}} for i in range(10)]
+    response = asyncio.run(
+        async_bulk_raw(
+            client,
+            name="mock-dataset",
+            bulk_class=TextClassificationBulkData,
+            body=iter_bulk_body(tags={}, metadata={}, records=records),
+            compress=True,
+        )
+    )
+
+    assert response.parsed.processed == 10
+    assert sent["body"]["records"] == records
+    assert sent["streamed"] is streamed
+    assert sent["encoding"] == expected_encoding
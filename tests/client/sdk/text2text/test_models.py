@@ -92,6 +92,20 @@ def test_from_client_agent(pred_agent, annot_agent, pred_expected, annot_expecte
     assert sdk_record.prediction.agent == pred_expected
 
 
+def test_dict_from_client():
+    record = Text2TextRecord(
+        text="test",
+        prediction=["prediction", ("scored prediction", 0.5)],
+        annotation="annotation",
+        event_timestamp=datetime(2000, 1, 1),
+        id=1,
+    )
+
+    assert CreationText2TextRecord.dict_from_client(
+        record
+    ) == CreationText2TextRecord.from_client(record).dict(by_alias=True)
+
+
 def test_to_client():
     prediction = Text2TextAnnotation(
         sentences=[
@@ -123,3 +137,23 @@ def test_to_client():
     assert record.annotation == "annot_prueba"
     assert record.annotation_agent == "annot_agent"
     assert record.metrics == {"tokens_length": 42}
+
+
+def test_dict_to_client():
+    data = {
+        "id": 1,
+        "text": "test",
+        "status": "Validated",
+        "event_timestamp": "2000-01-01T00:00:00",
+        "prediction": {
+            "agent": "pred_agent",
+            "sentences": [{"text": "prediction", "score": 0.5}],
+        },
+        "annotation": {"agent": "annot_agent", "sentences": [{"text": "annotation"}]},
+        "metadata": {"mock": "metadata"},
+    }
+
+    assert (
+        SdkText2TextRecord.dict_to_client(data)
+        == SdkText2TextRecord(**data).to_client()
+    )
@@ -130,6 +130,26 @@ def test_from_client_agent(pred_agent, annot_agent, pred_expected, annot_expecte
     assert sdk_record.metrics == {}
 
 
+@pytest.mark.parametrize("multi_label", [False, True])
+def test_dict_from_client(multi_label):
+    record = TextClassificationRecord(
+        inputs={"text": "test", "context": "context"},
+        prediction=[("label1", 0.5), ("label2", 0.5)],
+        annotation=["label1"] if multi_label else "label1",
+        multi_label=multi_label,
+        explanation={
+            "text": [TokenAttributions(token="test", attributions={"label1": 1.0})]
+        },
+        event_timestamp=datetime(2000, 1, 1),
+        metadata={"mock": "metadata"},
+        id=1,
+    )
+
+    assert CreationTextClassificationRecord.dict_from_client(
+        record
+    ) == CreationTextClassificationRecord.from_client(record).dict(by_alias=True)
+
+
 @pytest.mark.parametrize(
     "multi_label,expected", [(False, "annot_label"), (True, ["annot_label"])]
 )
@@ -162,3 +182,28 @@ def test_to_client(multi_label, expected):
     assert record.annotation_agent == "annot_agent"
     assert record.annotation == expected
     assert record.metrics == {"tokens_length": 42}
+
+
+@pytest.mark.parametrize("multi_label", [False, True])
+def test_dict_to_client(multi_label):
+    data = {
+        "id": 1,
+        "inputs": {"text": "test"},
+        "multi_label": multi_label,
+        "status": "Validated",
+        "event_timestamp": "2000-01-01T00:00:00",
+        "metadata": {"mock": "metadata"},
+        "prediction": {
+            "agent": "pred_agent",
+            "labels": [{"class": "label1", "score": 0.5}],
+        },
+        "annotation": {"agent": "annot_agent", "labels": [{"class": "label1"}]},
+        "explanation": {"text": [{"token": "test", "attributions": {"label1": 1.0}}]},
+        "metrics": {"mock": "metric"},
+        "search_keywords": ["test"],
+    }
+
+    assert (
+        SdkTextClassificationRecord.dict_to_client(data)
+        == SdkTextClassificationRecord(**data).to_client()
+    )
@@ -93,6 +93,21 @@ def test_from_client_agent(pred_agent, annot_agent, pred_expected, annot_expecte
     assert sdk_record.annotation.agent == annot_expected
 
 
+def test_dict_from_client():
+    record = TokenClassificationRecord(
+        text="test text",
+        tokens=["test", "text"],
+        prediction=[("label", 0, 4), ("label", 5, 9, 0.5)],
+        annotation=[("label", 0, 4)],
+        event_timestamp=datetime(2000, 1, 1),
+        id=1,
+    )
+
+    assert CreationTokenClassificationRecord.dict_from_client(
+        record
+    ) == CreationTokenClassificationRecord.from_client(record).dict(by_alias=True)
+
+
 def test_to_client():
     prediction = TokenClassificationAnnotation(
         entities=[EntitySpan(label="pred_label", start=0, end=4)], agent="pred_agent"
@@ -118,3 +133,27 @@ def test_to_client():
     assert record.annotation == [("annot_label", 5, 7)]
     assert record.annotation_agent == "annot_agent"
     assert record.metrics == {"tokens_length": 42}
+
+
+def test_dict_to_client():
+    data = {
+        "id": 1,
+        "text": "test text",
+        "tokens": ["test", "text"],
+        "status": "Validated",
+        "event_timestamp": "2000-01-01T00:00:00",
+        "prediction": {
+            "agent": "pred_agent",
+            "entities": [{"label": "label", "start": 0, "end": 4, "score": 0.5}],
+        },
+        "annotation": {
+            "agent": "annot_agent",
+            "entities": [{"label": "label", "start": 5, "end": 9}],
+        },
+        "metrics": {"mock": "metric"},
+    }
+
+    assert (
+        SdkTokenClassificationRecord.dict_to_client(data)
+        == SdkTokenClassificationRecord(**data).to_client()
+    )
@@ -12,8 +12,12 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import asyncio
 import concurrent.futures
 import datetime
+import gc
+import http.server
+import threading
 from time import sleep
 from typing import Iterable
 
@@ -25,7 +29,9 @@ import pytest
 import rubrix as rb
 from rubrix.client import api
 from rubrix.client.api import InputValueError
+from rubrix.client.apis.status import ApiInfo, Status
 from rubrix.client.sdk.client import AuthenticatedClient
+from rubrix.client.sdk.commons.api import build_param_dict
 from rubrix.client.sdk.commons.errors import (
     AlreadyExistsApiError,
     ForbiddenApiError,
@@ -34,11 +40,19 @@ from rubrix.client.sdk.commons.errors import (
     UnauthorizedApiError,
     ValidationApiError,
 )
+from rubrix.client.sdk.commons.models import Response
+from rubrix.client.sdk.datasets import api as datasets_api
+from rubrix.client.sdk.datasets.models import Dataset as SdkDataset
+from rubrix.client.sdk.datasets.models import TaskType
+from rubrix.client.sdk.metrics import api as metrics_api
+from rubrix.client.sdk.metrics.models import MetricInfo
+from rubrix.client.sdk.text_classification.models import TextClassificationQuery
 from rubrix.client.sdk.users import api as users_api
 from rubrix.client.sdk.users.models import User
 from rubrix.server.apis.v0.models.text_classification import (
     TextClassificationSearchResults,
 )
+from rubrix.utils import setup_loop_in_thread
 from tests.server.test_api import create_some_data_for_text_classification
 
 
@@ -133,6 +147,273 @@ def test_trailing_slash(mock_response_200):
     assert api.__ACTIVE_API__._client.base_url == "http://mock.com"
 
 
+def test_close(mock_response_200, monkeypatch):
+    loop, _ = setup_loop_in_thread()
+
+    with api.Api() as rb_api:
+
+        async def get_async_httpx():
+            return rb_api.client.get_async_httpx()
+
+        async_httpx = asyncio.run_coroutine_threadsafe(get_async_httpx(), loop).result()
+        closed_from = []
+
+        async def mock_aclose():
+            closed_from.append(asyncio.get_running_loop())
+
+        monkeypatch.setattr(async_httpx, "aclose", mock_aclose)
+
+    assert closed_from == [loop]
+    assert not rb_api.client.__async_httpx_clients__
+    assert rb_api.client.__httpx__.is_closed
+
+
+def test_async_httpx_closed_when_released(mock_response_200):
+    loop, _ = setup_loop_in_thread()
+    client = AuthenticatedClient(base_url="http://localhost:6900", token="mock")
+
+    async def get_async_httpx():
+        return client.get_async_httpx()
+
+    async_httpx = asyncio.run_coroutine_threadsafe(get_async_httpx(), loop).result()
+    closed = []
+    closed_event = threading.Event()
+
+    async def mock_aclose():
+        closed.append(asyncio.get_running_loop())
+        closed_event.set()
+
+    async_httpx.aclose = mock_aclose
+    del client
+    assert closed_event.wait(timeout=5) and closed == [loop]
+
+
+def test_async_httpx_requests_from_different_loops():
+    class SlowHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            sleep(0.5)
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    client = AuthenticatedClient(base_url=url, token="mock")
+
+    async def get():
+        return (await client.get_async_httpx().get(url)).text
+
+    loop, _ = setup_loop_in_thread()
+    try:
+        background_request = asyncio.run_coroutine_threadsafe(get(), loop)
+        sleep(0.1)
+        # A request from another loop must not close the client in use by the background loop
+        assert asyncio.run(get()) == "ok"
+        assert background_request.result(timeout=5) == "ok"
+        assert len(client.__async_httpx_clients__) == 1
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_log_with_validation_error(mock_response_200, monkeypatch):
+    class MockAsyncHttpx:
+        async def post(self, *args, **kwargs):
+            return httpx.Response(
+                status_code=422,
+                json={
+                    "detail": {
+                        "code": "rubrix.api.errors::ValidationError",
+                        "params": {
+                            "errors": [
+                                {
+                                    "loc": ["body", "records", 0, "prediction"],
+                                    "msg": "mock error",
+                                    "type": "value_error",
+                                }
+                            ]
+                        },
+                    }
+                },
+            )
+
+    rb_api = api.Api(compress=False)
+    monkeypatch.setattr(rb_api.client, "get_async_httpx", MockAsyncHttpx)
+
+    record = rb.TextClassificationRecord(text="mock", prediction=[("mock", 2.0)])
+    with pytest.raises(ValidationApiError) as error:
+        asyncio.run(rb_api.log_async(record, name="mock-dataset", verbose=False))
+
+    error_value = error.value.ctx["params"]["errors"][0]["value"]
+    assert error_value["labels"] == [{"class": "mock", "score": 2.0}]
+
+
+def test_log_async_cleans_up_after_a_failed_bulk(mock_response_200, monkeypatch):
+    posts, cancelled, closed_bars, loop_errors = [], [], [], []
+
+    class MockAsyncHttpx:
+        async def post(self, *args, **kwargs):
+            posts.append(len(posts))
+            if len(posts) == 1:
+                return httpx.Response(
+                    status_code=200,
+                    json={"dataset": "mock-dataset", "processed": 1, "failed": 0},
+                )
+            if len(posts) in (2, 3):
+                return httpx.Response(status_code=500, json={"detail": "mock"})
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(len(posts))
+                raise
+
+    class MockProgressBar:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def update(self, n):
+            pass
+
+        def close(self):
+            closed_bars.append(self)
+
+    rb_api = api.Api(compress=False)
+    monkeypatch.setattr(rb_api.client, "get_async_httpx", MockAsyncHttpx)
+    monkeypatch.setattr(api, "tqdm", MockProgressBar)
+
+    async def log():
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: loop_errors.append(context)
+        )
+        records = [rb.TextClassificationRecord(text="mock") for _ in range(5)]
+        try:
+            await rb_api.log_async(
+                records, name="mock-dataset", chunk_size=1, concurrency=3
+            )
+        finally:
+            # Unretrieved task exceptions are reported when the tasks are collected
+            gc.collect()
+
+    with pytest.raises(GenericApiError):
+        asyncio.run(log())
+
+    assert cancelled == [4]
+    assert len(closed_bars) == 1
+    assert loop_errors == []
+
+
+@pytest.mark.parametrize(
+    "server_version, expected_encoding",
+    [("0.17.0.dev0", "gzip"), ("0.17.1", "gzip"), ("0.16.1", None)],
+)
+def test_log_compression_depends_on_server_version(
+    mock_response_200, monkeypatch, server_version, expected_encoding
+):
+    sent_headers = []
+
+    class MockAsyncHttpx:
+        async def post(self, *args, headers, content, **kwargs):
+            sent_headers.append(headers)
+            return httpx.Response(
+                status_code=200,
+                json={"dataset": "mock-dataset", "processed": 1, "failed": 0},
+            )
+
+    monkeypatch.setattr(
+        Status, "get_info", lambda self: ApiInfo(rubrix_version=server_version)
+    )
+    rb_api = api.Api()
+    monkeypatch.setattr(rb_api.client, "get_async_httpx", MockAsyncHttpx)
+
+    for _ in range(2):
+        asyncio.run(
+            rb_api.log_async(
+                # large enough to be worth compressing
+                rb.TextClassificationRecord(text="mock text" * 1000),
+                name="mock-dataset",
+                verbose=False,
+            )
+        )
+
+    assert [h.get("Content-Encoding") for h in sent_headers] == [expected_encoding] * 2
+
+
+def test_dataset_metrics_are_cached(mock_response_200, monkeypatch):
+    get_dataset_calls, get_metrics_calls = [], []
+
+    def mock_get_dataset(client, name):
+        get_dataset_calls.append(name)
+        return Response(
+            status_code=200,
+            content=b"",
+            headers={},
+            parsed=SdkDataset(name=name, task=TaskType.text_classification),
+        )
+
+    def mock_get_dataset_metrics(client, name, task):
+        get_metrics_calls.append(name)
+        return Response(
+            status_code=200,
+            content=b"",
+            headers={},
+            parsed=[MetricInfo(id="mock", name="Mock metric")],
+        )
+
+    monkeypatch.setattr(datasets_api, "get_dataset", mock_get_dataset)
+    monkeypatch.setattr(datasets_api, "delete_dataset", lambda client, name: None)
+    monkeypatch.setattr(metrics_api, "get_dataset_metrics", mock_get_dataset_metrics)
+
+    rb_api = api.Api()
+    rb_api.dataset_metrics("mock_dataset")
+    assert rb_api.get_metric("mock_dataset", metric="mock").id == "mock"
+    assert get_dataset_calls == get_metrics_calls == ["mock_dataset"]
+
+    rb_api.delete("mock_dataset")
+    rb_api.dataset_metrics("mock_dataset")
+    assert get_dataset_calls == get_metrics_calls == ["mock_dataset"] * 2
+
+
+def test_iter_load_pages_after_falsy_ids(mock_response_200, monkeypatch):
+    records = [rb.TextClassificationRecord(id=i, text="mock") for i in range(3)]
+    requested_params = []
+
+    def mock_data(client, name, request, limit, id_from, to_client):
+        requested_params.append(build_param_dict(id_from, limit))
+        assert len(requested_params) <= len(records) + 1, "the same page is fetched"
+        # the server sorts the ids as keywords
+        page = [r for r in records if id_from is None or str(r.id) > id_from]
+        return Response(status_code=200, content=b"", headers={}, parsed=page[:limit])
+
+    rb_api = api.Api()
+    monkeypatch.setattr(
+        rb_api,
+        "_load_config",
+        lambda name: (
+            mock_data,
+            TextClassificationQuery,
+            rb.DatasetForTextClassification,
+        ),
+    )
+
+    async def load_batches():
+        return [batch async for batch in rb_api.iter_load(name="mock", batch_size=1)]
+
+    batches = asyncio.run(load_batches())
+    assert [record.id for batch in batches for record in batch] == [0, 1, 2]
+    assert requested_params == [
+        {"limit": 1},
+        {"limit": 1, "id_from": "0"},
+        {"limit": 1, "id_from": "1"},
+        {"limit": 1, "id_from": "2"},
+    ]
+
+
 def test_log_something(monkeypatch, mocked_client):
     dataset_name = "test-dataset"
     mocked_client.delete(f"/api/datasets/{dataset_name}")
@@ -171,6 +452,26 @@ def test_load_limits(mocked_client):
     assert len(ds) == limit_data_to
 
 
+@pytest.mark.parametrize(
+    "batch_size, expected_sizes", [(10, [10, 10, 5]), (1, [1] * 25)]
+)
+def test_iter_load(mocked_client, batch_size, expected_sizes):
+    dataset = "test_iter_load"
+    mocked_client.delete(f"/api/datasets/{dataset}")
+
+    create_some_data_for_text_classification(mocked_client, dataset, 25)
+
+    async def load_batches():
+        return [
+            batch async for batch in api.iter_load(name=dataset, batch_size=batch_size)
+        ]
+
+    batches = asyncio.run(load_batches())
+    assert [len(batch) for batch in batches] == expected_sizes
+    ids = [record.id for batch in batches for record in batch]
+    assert sorted(ids) == list(range(25))
+
+
 def test_log_records_with_too_long_text(mocked_client):
     dataset_name = "test_log_records_with_too_long_text"
     mocked_client.delete(f"/api/datasets/{dataset_name}")
@@ -327,6 +628,33 @@ def test_log_with_generator(mocked_client, monkeypatch):
     api.log(generator(), name=dataset_name)
 
 
+def test_log_with_generator_in_concurrent_chunks(mocked_client):
+    dataset_name = "test_log_with_generator_in_concurrent_chunks"
+    mocked_client.delete(f"/api/datasets/{dataset_name}")
+
+    records = (
+        rb.TextClassificationRecord(id=i, inputs={"text": "The text data"})
+        for i in range(0, 10)
+    )
+    response = api.log(records, name=dataset_name, chunk_size=3, concurrency=2)
+    assert response.processed == 10
+
+    dataset = api.load(dataset_name)
+    assert [record.id for record in dataset] == list(range(0, 10))
+
+
+def test_log_with_positional_arguments(mocked_client):
+    dataset_name = "test_log_with_positional_arguments"
+    mocked_client.delete(f"/api/datasets/{dataset_name}")
+
+    records = [
+        rb.TextClassificationRecord(id=i, inputs={"text": "The text data"})
+        for i in range(0, 10)
+    ]
+    response = api.log(records, dataset_name, None, None, 5, False)
+    assert response.processed == 10
+
+
 def test_create_ds_with_wrong_name(mocked_client):
     dataset_name = "Test Create_ds_with_wrong_name"
 
@@ -69,6 +69,11 @@ class SecuredClient:
         return self._client.post(*args, headers=headers, **kwargs)
 
     async def post_async(self, *args, **kwargs):
+        if "content" in kwargs:
+            content = kwargs.pop("content")
+            if not isinstance(content, bytes):
+                content = b"".join([piece async for piece in content])
+            kwargs["data"] = content
         return self.post(*args, **kwargs)
 
     def get(self, *args, **kwargs):
@@ -0,0 +1,81 @@
+#  coding=utf-8
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import gzip
+
+import pytest
+from fastapi import FastAPI, Request
+from starlette.testclient import TestClient
+
+from rubrix.server.gzip_request import GZipRequestMiddleware
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(GZipRequestMiddleware, max_size=1024)
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        return await request.json()
+
+    return TestClient(app)
+
+
+def test_gzip_encoded_body(client):
+    response = client.post(
+        "/echo",
+        data=gzip.compress(b'{"mock": "data"}'),
+        headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"mock": "data"}
+
+
+def test_plain_body(client):
+    response = client.post("/echo", json={"mock": "data"})
+
+    assert response.status_code == 200
+    assert response.json() == {"mock": "data"}
+
+
+def test_invalid_gzip_body(client):
+    response = client.post(
+        "/echo",
+        data=b'{"mock": "data"}',
+        headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_truncated_gzip_body(client):
+    response = client.post(
+        "/echo",
+        data=gzip.compress(b'{"mock": "data"}')[:-4],
+        headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_too_large_gzip_body(client):
+    response = client.post(
+        "/echo",
+        data=gzip.compress(b'{"mock": "%b"}' % (b"0" * 2048)),
+        headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 413
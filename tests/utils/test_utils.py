@@ -12,9 +12,11 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from rubrix.utils import LazyRubrixModule
+from rubrix.utils import LazyRubrixModule, setup_loop_in_thread
 
 
 def test_lazy_rubrix_module(monkeypatch):
@@ -65,3 +67,17 @@ def test_lazy_rubrix_module_import_error(monkeypatch):
 
     with pytest.raises(RuntimeError, match="Failed to import rb_mock.mock_module"):
         lazy_module.mock_module
+
+
+def test_setup_loop_in_thread_is_shared():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        loops_and_threads = list(
+            executor.map(lambda _: setup_loop_in_thread(), range(0, 8))
+        )
+
+    loop, thread = loops_and_threads[0]
+    assert thread.is_alive()
+    assert all(
+        other_loop is loop and other_thread is thread
+        for other_loop, other_thread in loops_and_threads
+    )